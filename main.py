@@ -1,10 +1,10 @@
+import argparse
 import os
-from typing import Optional, Dict, Any
+import sys
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from datetime import datetime
 from models.inventory import Inventory
-from models.electronics import Electronics
-from models.grocery import Grocery
-from models.clothing import Clothing
+from models.product import Product
 from exceptions.custom_exceptions import (
     InventoryError,
     InsufficientStockError,
@@ -17,100 +17,156 @@ from exceptions.custom_exceptions import (
 class InventoryCLI:
     """Command-line interface for the inventory management system."""
     
-    def __init__(self):
-        """Initialize the CLI with an empty inventory."""
+    # Mapping of product type menu choices to product type names
+    PRODUCT_TYPE_CHOICES: Dict[str, str] = {
+        "0": "",
+        "1": "Electronics",
+        "2": "Grocery",
+        "3": "Clothing"
+    }
+    
+    # Prompts for the fields shared by every product: (field, converter, prompt)
+    COMMON_PROMPTS: List[Tuple[str, Callable[[str], Any], str]] = [
+        ("product_id", str, "Product ID: "),
+        ("name", str, "Name: "),
+        ("price", float, "Price: "),
+        ("quantity_in_stock", int, "Quantity in stock: ")
+    ]
+    
+    # Prompts for the fields specific to each product type
+    PROMPTS: Dict[str, List[Tuple[str, Callable[[str], Any], str]]] = {
+        "Electronics": [
+            ("warranty_years", int, "Warranty (years): "),
+            ("brand", str, "Brand: ")
+        ],
+        "Grocery": [
+            ("expiry_date", str, "Expiry date (YYYY-MM-DD): ")
+        ],
+        "Clothing": [
+            ("size", str, "Size: "),
+            ("material", str, "Material: ")
+        ]
+    }
+    
+    def __init__(self, batch: bool = False):
+        """
+        Initialize the CLI with an empty inventory.
+        
+        Args:
+            batch (bool): Read commands one per line without redrawing the menu
+        """
         self.inventory = Inventory()
         self.running = True
+        self.batch = batch
+        # Whether the screen must be cleared and the menu shown again
+        self._need_redraw = True
+        self._menu = {
+            "0": self._exit,
+            "1": self.add_product,
+            "2": self.remove_product,
+            "3": self.search_products,
+            "4": self.list_products,
+            "5": self.sell_product,
+            "6": self.restock_product,
+            "7": self.remove_expired,
+            "8": self.save_inventory,
+            "9": self.load_inventory,
+            "10": self.show_total_value
+        }
+    
+    def _prompt(self, message: str) -> str:
+        """
+        Write a prompt and read one line of input from stdin.
+        
+        Args:
+            message (str): Prompt to display
+            
+        Returns:
+            str: The entered line with surrounding whitespace removed
+            
+        Raises:
+            EOFError: If stdin is exhausted
+        """
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+    
+    def _render(self, *lines: str) -> None:
+        """Write several lines of output in a single call."""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _render_products(self, title: str, products: List[Product]) -> None:
+        """Write a titled listing of products in a single call."""
+        parts = [title]
+        for product in products:
+            parts.append("\n" + "=" * 30)
+            parts.append(str(product))
+        self._render(*parts)
     
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        elif sys.stdout.isatty():
+            # ANSI clear + cursor home, without spawning a shell
+            sys.stdout.write("\x1b[2J\x1b[H")
     
     def print_header(self) -> None:
         """Print the application header."""
-        print("=" * 50)
-        print("Inventory Management System".center(50))
-        print("=" * 50)
-        print()
+        self._render(
+            "=" * 50,
+            "Inventory Management System".center(50),
+            "=" * 50,
+            ""
+        )
     
     def print_menu(self) -> None:
         """Print the main menu options."""
-        print("\nMain Menu:")
-        print("1. Add Product")
-        print("2. Remove Product")
-        print("3. Search Products")
-        print("4. List All Products")
-        print("5. Sell Product")
-        print("6. Restock Product")
-        print("7. Remove Expired Products")
-        print("8. Save Inventory")
-        print("9. Load Inventory")
-        print("10. Show Total Inventory Value")
-        print("0. Exit")
-        print()
+        self._render(
+            "\nMain Menu:",
+            "1. Add Product",
+            "2. Remove Product",
+            "3. Search Products",
+            "4. List All Products",
+            "5. Sell Product",
+            "6. Restock Product",
+            "7. Remove Expired Products",
+            "8. Save Inventory",
+            "9. Load Inventory",
+            "10. Show Total Inventory Value",
+            "0. Exit",
+            ""
+        )
     
     def get_product_type(self) -> str:
         """Get the product type from user input."""
         while True:
-            print("\nSelect product type:")
-            print("1. Electronics")
-            print("2. Grocery")
-            print("3. Clothing")
-            print("0. Back to main menu")
+            self._render(
+                "\nSelect product type:",
+                "1. Electronics",
+                "2. Grocery",
+                "3. Clothing",
+                "0. Back to main menu"
+            )
             
-            choice = input("\nEnter your choice (0-3): ").strip()
+            choice = self._prompt("\nEnter your choice (0-3): ")
             
-            if choice == "0":
-                return ""
-            elif choice == "1":
-                return "Electronics"
-            elif choice == "2":
-                return "Grocery"
-            elif choice == "3":
-                return "Clothing"
-            else:
-                print("Invalid choice. Please try again.")
+            if choice in self.PRODUCT_TYPE_CHOICES:
+                return self.PRODUCT_TYPE_CHOICES[choice]
+            print("Invalid choice. Please try again.")
     
     def get_product_data(self, product_type: str) -> Optional[Dict[str, Any]]:
         """Get product data from user input."""
         try:
             print("\nEnter product details:")
-            product_id = input("Product ID: ").strip()
-            name = input("Name: ").strip()
-            price = float(input("Price: ").strip())
-            quantity = int(input("Quantity in stock: ").strip())
-            
-            if product_type == "Electronics":
-                warranty = int(input("Warranty (years): ").strip())
-                brand = input("Brand: ").strip()
-                return {
-                    'product_id': product_id,
-                    'name': name,
-                    'price': price,
-                    'quantity_in_stock': quantity,
-                    'warranty_years': warranty,
-                    'brand': brand
-                }
-            elif product_type == "Grocery":
-                expiry = input("Expiry date (YYYY-MM-DD): ").strip()
-                return {
-                    'product_id': product_id,
-                    'name': name,
-                    'price': price,
-                    'quantity_in_stock': quantity,
-                    'expiry_date': expiry
-                }
-            elif product_type == "Clothing":
-                size = input("Size: ").strip()
-                material = input("Material: ").strip()
-                return {
-                    'product_id': product_id,
-                    'name': name,
-                    'price': price,
-                    'quantity_in_stock': quantity,
-                    'size': size,
-                    'material': material
-                }
+            fields = self.COMMON_PROMPTS + self.PROMPTS[product_type]
+            return {
+                field: convert(self._prompt(message))
+                for field, convert, message in fields
+            }
         except ValueError as e:
             print(f"Error: Invalid input - {str(e)}")
             return None
@@ -126,21 +182,15 @@ class InventoryCLI:
             return
         
         try:
-            if product_type == "Electronics":
-                product = Electronics(**product_data)
-            elif product_type == "Grocery":
-                product = Grocery(**product_data)
-            else:  # Clothing
-                product = Clothing(**product_data)
-            
+            product = Inventory.PRODUCT_TYPES[product_type](**product_data)
             self.inventory.add_product(product)
             print("\nProduct added successfully!")
-        except InventoryError as e:
+        except (ValueError, InventoryError) as e:
             print(f"\nError: {str(e)}")
     
     def remove_product(self) -> None:
         """Remove a product from the inventory."""
-        product_id = input("\nEnter product ID to remove: ").strip()
+        product_id = self._prompt("\nEnter product ID to remove: ")
         try:
             self.inventory.remove_product(product_id)
             print("\nProduct removed successfully!")
@@ -149,17 +199,19 @@ class InventoryCLI:
     
     def search_products(self) -> None:
         """Search for products in the inventory."""
-        print("\nSearch options:")
-        print("1. Search by name")
-        print("2. Search by type")
-        print("0. Back to main menu")
+        self._render(
+            "\nSearch options:",
+            "1. Search by name",
+            "2. Search by type",
+            "0. Back to main menu"
+        )
         
-        choice = input("\nEnter your choice (0-2): ").strip()
+        choice = self._prompt("\nEnter your choice (0-2): ")
         
         if choice == "0":
             return
         elif choice == "1":
-            name = input("\nEnter product name to search: ").strip()
+            name = self._prompt("\nEnter product name to search: ")
             products = self.inventory.search_by_name(name)
         elif choice == "2":
             product_type = self.get_product_type()
@@ -177,10 +229,7 @@ class InventoryCLI:
         if not products:
             print("\nNo products found.")
         else:
-            print(f"\nFound {len(products)} products:")
-            for product in products:
-                print("\n" + "=" * 30)
-                print(product)
+            self._render_products(f"\nFound {len(products)} products:", products)
     
     def list_products(self) -> None:
         """List all products in the inventory."""
@@ -188,16 +237,13 @@ class InventoryCLI:
         if not products:
             print("\nInventory is empty.")
         else:
-            print(f"\nInventory ({len(products)} products):")
-            for product in products:
-                print("\n" + "=" * 30)
-                print(product)
+            self._render_products(f"\nInventory ({len(products)} products):", products)
     
     def sell_product(self) -> None:
         """Sell a quantity of a product."""
-        product_id = input("\nEnter product ID: ").strip()
+        product_id = self._prompt("\nEnter product ID: ")
         try:
-            quantity = int(input("Enter quantity to sell: ").strip())
+            quantity = int(self._prompt("Enter quantity to sell: "))
             total = self.inventory.sell_product(product_id, quantity)
             print(f"\nSale successful! Total: ${total:.2f}")
         except (ValueError, ProductNotFoundError, InsufficientStockError) as e:
@@ -205,9 +251,9 @@ class InventoryCLI:
     
     def restock_product(self) -> None:
         """Restock a product."""
-        product_id = input("\nEnter product ID: ").strip()
+        product_id = self._prompt("\nEnter product ID: ")
         try:
-            quantity = int(input("Enter quantity to add: ").strip())
+            quantity = int(self._prompt("Enter quantity to add: "))
             self.inventory.restock_product(product_id, quantity)
             print("\nProduct restocked successfully!")
         except (ValueError, ProductNotFoundError) as e:
@@ -219,13 +265,14 @@ class InventoryCLI:
         if not expired_ids:
             print("\nNo expired products found.")
         else:
-            print(f"\nRemoved {len(expired_ids)} expired products:")
-            for product_id in expired_ids:
-                print(f"- {product_id}")
+            self._render(
+                f"\nRemoved {len(expired_ids)} expired products:",
+                *(f"- {product_id}" for product_id in expired_ids)
+            )
     
     def save_inventory(self) -> None:
         """Save the inventory to a file."""
-        filename = input("\nEnter filename to save (default: inventory.json): ").strip()
+        filename = self._prompt("\nEnter filename to save (default: inventory.json): ")
         if not filename:
             filename = "inventory.json"
         
@@ -237,7 +284,7 @@ class InventoryCLI:
     
     def load_inventory(self) -> None:
         """Load the inventory from a file."""
-        filename = input("\nEnter filename to load (default: inventory.json): ").strip()
+        filename = self._prompt("\nEnter filename to load (default: inventory.json): ")
         if not filename:
             filename = "inventory.json"
         
@@ -252,43 +299,44 @@ class InventoryCLI:
         total = self.inventory.total_inventory_value()
         print(f"\nTotal inventory value: ${total:.2f}")
     
+    def _exit(self) -> None:
+        """Stop the main CLI loop."""
+        self.running = False
+    
     def run(self) -> None:
-        """Run the main CLI loop."""
-        while self.running:
-            self.clear_screen()
-            self.print_header()
-            self.print_menu()
-            
-            choice = input("Enter your choice (0-10): ").strip()
-            
-            if choice == "0":
-                self.running = False
-            elif choice == "1":
-                self.add_product()
-            elif choice == "2":
-                self.remove_product()
-            elif choice == "3":
-                self.search_products()
-            elif choice == "4":
-                self.list_products()
-            elif choice == "5":
-                self.sell_product()
-            elif choice == "6":
-                self.restock_product()
-            elif choice == "7":
-                self.remove_expired()
-            elif choice == "8":
-                self.save_inventory()
-            elif choice == "9":
-                self.load_inventory()
-            elif choice == "10":
-                self.show_total_value()
-            else:
-                print("\nInvalid choice. Please try again.")
-            
-            if self.running:
-                input("\nPress Enter to continue...")
+        """Run the main CLI loop until the user exits or input runs out."""
+        try:
+            while self.running:
+                if self._need_redraw and not self.batch:
+                    self.clear_screen()
+                    self.print_header()
+                    self.print_menu()
+                    self._need_redraw = False
+                
+                choice = self._prompt("Enter your choice (0-10): ")
+                
+                handler = self._menu.get(choice)
+                if not handler:
+                    # The menu is still on screen, so just ask again
+                    print("\nInvalid choice. Please try again.")
+                    continue
+                
+                handler()
+                if self.running and not self.batch:
+                    self._prompt("\nPress Enter to continue...")
+                    self._need_redraw = True
+        except EOFError:
+            # End of input is the normal end of a --batch command file
+            self.running = False
+            print()
 
 if __name__ == "__main__":
-    cli = InventoryCLI()
+    parser = argparse.ArgumentParser(description="Inventory Management System")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="read commands from stdin one per line without redrawing the menu"
+    )
+    args = parser.parse_args()
+    cli = InventoryCLI(batch=args.batch)
     cli.run() 
\ No newline at end of file
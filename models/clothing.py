@@ -4,6 +4,8 @@ from .product import Product
 class Clothing(Product):
     """Class representing clothing products in the inventory."""
     
+    __slots__ = ('_size', '_material')
+    
     def __init__(self, product_id: str, name: str, price: float, 
                  quantity_in_stock: int, size: str, material: str):
         """
@@ -38,16 +40,16 @@ class Clothing(Product):
         Returns:
             Dict[str, Any]: Dictionary representation of the product
         """
-        base_dict = super().to_dict()
-        base_dict.update({
+        return {
+            **super().to_dict(),
             'size': self._size,
             'material': self._material
-        })
-        return base_dict
+        }
     
     def __str__(self) -> str:
         """Return a string representation of the clothing product."""
-        base_str = super().__str__()
-        return (f"{base_str}\n"
-                f"Size: {self._size}\n"
-                f"Material: {self._material}") 
\ No newline at end of file
+        if self._str_cache is None:
+            self._str_cache = (f"{super().__str__()}\n"
+                               f"Size: {self._size}\n"
+                               f"Material: {self._material}")
+        return self._str_cache 
\ No newline at end of file
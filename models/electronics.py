@@ -5,6 +5,8 @@ from .product import Product
 class Electronics(Product):
     """Class representing electronic products in the inventory."""
     
+    __slots__ = ('_warranty_years', '_brand')
+    
     def __init__(self, product_id: str, name: str, price: float, 
                  quantity_in_stock: int, warranty_years: int, brand: str):
         """
@@ -39,16 +41,16 @@ class Electronics(Product):
         Returns:
             Dict[str, Any]: Dictionary representation of the product
         """
-        base_dict = super().to_dict()
-        base_dict.update({
+        return {
+            **super().to_dict(),
             'warranty_years': self._warranty_years,
             'brand': self._brand
-        })
-        return base_dict
+        }
     
     def __str__(self) -> str:
         """Return a string representation of the electronic product."""
-        base_str = super().__str__()
-        return (f"{base_str}\n"
-                f"Brand: {self._brand}\n"
-                f"Warranty: {self._warranty_years} years") 
\ No newline at end of file
+        if self._str_cache is None:
+            self._str_cache = (f"{super().__str__()}\n"
+                               f"Brand: {self._brand}\n"
+                               f"Warranty: {self._warranty_years} years")
+        return self._str_cache 
\ No newline at end of file
@@ -1,11 +1,12 @@
-from typing import Dict, Any
-from datetime import datetime
-from dateutil.parser import parse
+from typing import Dict, Any, Optional
+from datetime import date, datetime
 from .product import Product
 
 class Grocery(Product):
     """Class representing grocery products in the inventory."""
     
+    __slots__ = ('_expiry_date', '_str_cache_date')
+    
     def __init__(self, product_id: str, name: str, price: float, 
                  quantity_in_stock: int, expiry_date: str):
         """
@@ -19,7 +20,14 @@ class Grocery(Product):
             expiry_date (str): Expiry date in ISO format (YYYY-MM-DD)
         """
         super().__init__(product_id, name, price, quantity_in_stock)
-        self._expiry_date = parse(expiry_date).date()
+        try:
+            self._expiry_date = date.fromisoformat(expiry_date)
+        except ValueError:
+            # Legacy files may hold dates in other formats
+            from dateutil.parser import parse
+            self._expiry_date = parse(expiry_date).date()
+        # Date the cached display string was built for, since its status depends on it
+        self._str_cache_date: Optional[date] = None
     
     @property
     def expiry_date(self) -> datetime.date:
@@ -33,7 +41,19 @@ class Grocery(Product):
         Returns:
             bool: True if the product has expired, False otherwise
         """
-        return datetime.now().date() > self._expiry_date
+        return self.is_expired_on(datetime.now().date())
+    
+    def is_expired_on(self, today: date) -> bool:
+        """
+        Check if the product has expired as of a given date.
+        
+        Args:
+            today (date): Date to check against
+            
+        Returns:
+            bool: True if the product has expired, False otherwise
+        """
+        return today > self._expiry_date
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -42,16 +62,18 @@ class Grocery(Product):
         Returns:
             Dict[str, Any]: Dictionary representation of the product
         """
-        base_dict = super().to_dict()
-        base_dict.update({
+        return {
+            **super().to_dict(),
             'expiry_date': self._expiry_date.isoformat()
-        })
-        return base_dict
+        }
     
     def __str__(self) -> str:
         """Return a string representation of the grocery product."""
-        base_str = super().__str__()
-        expiry_status = "EXPIRED" if self.is_expired() else "Valid"
-        return (f"{base_str}\n"
-                f"Expiry Date: {self._expiry_date.isoformat()}\n"
-                f"Status: {expiry_status}") 
\ No newline at end of file
+        today = datetime.now().date()
+        if self._str_cache is None or self._str_cache_date != today:
+            expiry_status = "EXPIRED" if self.is_expired_on(today) else "Valid"
+            self._str_cache = (f"{super().__str__()}\n"
+                               f"Expiry Date: {self._expiry_date.isoformat()}\n"
+                               f"Status: {expiry_status}")
+            self._str_cache_date = today
+        return self._str_cache 
\ No newline at end of file
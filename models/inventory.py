@@ -1,6 +1,16 @@
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, List, Optional, Tuple, Type, Any
+import heapq
+import itertools
 import json
-from datetime import datetime
+import mmap
+import os
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
 from .product import Product
 from .electronics import Electronics
 from .grocery import Grocery
@@ -12,6 +22,26 @@ from exceptions.custom_exceptions import (
     InvalidProductTypeError
 )
 
+# Sentinel for dict.pop so a missing key is detected with a single lookup
+_MISSING = object()
+
+def _encode_product(obj: Any) -> Dict[str, Any]:
+    """
+    Serialize products lazily while the JSON encoder walks the product list.
+    
+    Args:
+        obj (Any): Object the JSON encoder could not serialize natively
+        
+    Returns:
+        Dict[str, Any]: Dictionary representation of the product
+        
+    Raises:
+        TypeError: If the object is not a product
+    """
+    if isinstance(obj, Product):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class Inventory:
     """Class to manage a collection of products."""
     
@@ -25,6 +55,22 @@ class Inventory:
     def __init__(self):
         """Initialize an empty inventory."""
         self._products: Dict[str, Product] = {}
+        # Secondary index of products bucketed by type name
+        self._by_type: Dict[str, Dict[str, Product]] = {
+            product_type: {} for product_type in self.PRODUCT_TYPES
+        }
+        # Bucket name for each concrete class seen, resolved once per class
+        self._type_keys: Dict[type, str] = {}
+        # Pre-lowercased names keyed by product ID, so searches don't
+        # re-normalize every product and removal is a single pop
+        self._name_index: Dict[str, Tuple[str, Product]] = {}
+        # Running total of stock value in cents, kept in sync by the products themselves
+        self._total_cents = 0
+        # Min-heap of (expiry_date, seq, product_id) for groceries; the unique
+        # seq breaks ties so product IDs are never compared. Entries for
+        # removed products are left in place and skipped when popped
+        self._expiry_heap: List[Tuple[date, int, str]] = []
+        self._expiry_seq = itertools.count()
     
     def add_product(self, product: Product) -> None:
         """
@@ -39,6 +85,42 @@ class Inventory:
         if product.product_id in self._products:
             raise DuplicateProductError(product.product_id)
         self._products[product.product_id] = product
+        self._index_product(product)
+        if isinstance(product, Grocery):
+            heapq.heappush(self._expiry_heap, self._expiry_entry(product))
+    
+    def _add_products(self, products: List[Product]) -> None:
+        """
+        Add several products at once, checking all IDs before inserting any.
+        
+        Args:
+            products (List[Product]): The products to add
+            
+        Raises:
+            DuplicateProductError: If an ID repeats or already exists
+        """
+        new_products = {product.product_id: product for product in products}
+        if (len(new_products) != len(products)
+                or not self._products.keys().isdisjoint(new_products)):
+            seen = set(self._products)
+            for product in products:
+                if product.product_id in seen:
+                    raise DuplicateProductError(product.product_id)
+                seen.add(product.product_id)
+        
+        self._products.update(new_products)
+        for product in products:
+            self._index_product(product)
+            if isinstance(product, Grocery):
+                self._expiry_heap.append(self._expiry_entry(product))
+        heapq.heapify(self._expiry_heap)
+    
+    def _index_product(self, product: Product) -> None:
+        """Record a newly added product in the secondary indexes and running total."""
+        self._by_type.setdefault(self._type_key(product), {})[product.product_id] = product
+        self._name_index[product.product_id] = (product.name_lower, product)
+        self._total_cents += product.stock_value_cents()
+        product.add_value_listener(self._adjust_total_value)
     
     def remove_product(self, product_id: str) -> None:
         """
@@ -50,9 +132,61 @@ class Inventory:
         Raises:
             ProductNotFoundError: If the product is not found
         """
-        if product_id not in self._products:
+        product = self._products.pop(product_id, _MISSING)
+        if product is _MISSING:
             raise ProductNotFoundError(product_id)
-        del self._products[product_id]
+        self._by_type[self._type_key(product)].pop(product_id, None)
+        self._name_index.pop(product_id, None)
+        self._release_value(product)
+        if isinstance(product, Grocery):
+            self._compact_expiry_heap()
+    
+    def _type_key(self, product: Product) -> str:
+        """
+        Get the type index bucket for a product.
+        
+        Subclasses of a registered product type share that type's bucket, so
+        search_by_type and the grocery expiry sweep see them too.
+        
+        Args:
+            product (Product): The product to classify
+            
+        Returns:
+            str: The registered product type name, or the class name for
+                products outside PRODUCT_TYPES
+        """
+        product_class = type(product)
+        key = self._type_keys.get(product_class)
+        if key is None:
+            key = next(
+                (name for name, registered in self.PRODUCT_TYPES.items()
+                 if issubclass(product_class, registered)),
+                product_class.__name__
+            )
+            self._type_keys[product_class] = key
+        return key
+    
+    def _expiry_entry(self, product: Grocery) -> Tuple[date, int, str]:
+        """Build the expiry heap entry for a grocery product."""
+        return (product.expiry_date, next(self._expiry_seq), product.product_id)
+    
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap once stale entries outnumber live ones."""
+        groceries = self._by_type['Grocery']
+        if len(self._expiry_heap) > 2 * len(groceries):
+            self._expiry_heap = [
+                self._expiry_entry(product) for product in groceries.values()
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _adjust_total_value(self, delta: int) -> None:
+        """Apply a change in a product's stock value (in cents) to the running total."""
+        self._total_cents += delta
+    
+    def _release_value(self, product: Product) -> None:
+        """Stop tracking a removed product's stock value."""
+        product.remove_value_listener(self._adjust_total_value)
+        self._total_cents -= product.stock_value_cents()
     
     def get_product(self, product_id: str) -> Product:
         """
@@ -67,9 +201,10 @@ class Inventory:
         Raises:
             ProductNotFoundError: If the product is not found
         """
-        if product_id not in self._products:
-            raise ProductNotFoundError(product_id)
-        return self._products[product_id]
+        try:
+            return self._products[product_id]
+        except KeyError:
+            raise ProductNotFoundError(product_id) from None
     
     def search_by_name(self, name: str) -> List[Product]:
         """
@@ -83,8 +218,8 @@ class Inventory:
         """
         name = name.lower()
         return [
-            product for product in self._products.values()
-            if name in product.name.lower()
+            product for name_lower, product in self._name_index.values()
+            if name in name_lower
         ]
     
     def search_by_type(self, product_type: str) -> List[Product]:
@@ -102,10 +237,7 @@ class Inventory:
         """
         if product_type not in self.PRODUCT_TYPES:
             raise InvalidProductTypeError(product_type)
-        return [
-            product for product in self._products.values()
-            if isinstance(product, self.PRODUCT_TYPES[product_type])
-        ]
+        return list(self._by_type[product_type].values())
     
     def list_all_products(self) -> List[Product]:
         """
@@ -154,7 +286,7 @@ class Inventory:
         Returns:
             float: Total value of inventory
         """
-        return sum(product.get_total_value() for product in self._products.values())
+        return self._total_cents / 100
     
     def remove_expired_products(self) -> List[str]:
         """
@@ -163,11 +295,17 @@ class Inventory:
         Returns:
             List[str]: List of IDs of removed products
         """
+        today = datetime.now().date()
+        groceries = self._by_type['Grocery']
         expired_ids = []
-        for product_id, product in list(self._products.items()):
-            if isinstance(product, Grocery) and product.is_expired():
-                del self._products[product_id]
-                expired_ids.append(product_id)
+        while self._expiry_heap and self._expiry_heap[0][0] < today:
+            expiry_date, _, product_id = heapq.heappop(self._expiry_heap)
+            product = groceries.get(product_id)
+            # Skip entries for products that were removed or replaced
+            if product is None or product.expiry_date != expiry_date:
+                continue
+            self.remove_product(product_id)
+            expired_ids.append(product_id)
         return expired_ids
     
     def save_to_file(self, filename: str) -> None:
@@ -177,13 +315,17 @@ class Inventory:
         Args:
             filename (str): Name of the file to save to
         """
-        data = {
-            'products': [
-                product.to_dict() for product in self._products.values()
-            ]
-        }
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Products are converted one at a time by _encode_product instead of
+        # building every product dictionary up front
+        data = {'products': list(self._products.values())}
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, default=_encode_product,
+                                     option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump writes the encoder's chunks to the file as they are produced
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, default=_encode_product)
     
     @classmethod
     def load_from_file(cls, filename: str) -> 'Inventory':
@@ -201,20 +343,35 @@ class Inventory:
         """
         inventory = cls()
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-            
-            for product_data in data.get('products', []):
-                product_type = product_data.pop('type', None)
-                if product_type not in cls.PRODUCT_TYPES:
-                    raise InvalidProductDataError(f"Unknown product type: {product_type}")
-                
-                product_class = cls.PRODUCT_TYPES[product_type]
-                try:
-                    product = product_class(**product_data)
-                    inventory.add_product(product)
-                except Exception as e:
-                    raise InvalidProductDataError(f"Error creating product: {str(e)}")
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        # Parse straight from a read-only mapping of the file
+                        # instead of copying it into a bytes object first
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                                memoryview(mm) as view:
+                            data = orjson.loads(view)
+                    else:
+                        # Empty files can't be mapped; let orjson report the error
+                        data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            
+            # Build every product first, then insert them in one batch
+            products = []
+            product_list = data.get('products', [])
+            try:
+                for product_data in product_list:
+                    product_type = product_data.pop('type', None)
+                    if product_type not in cls.PRODUCT_TYPES:
+                        raise InvalidProductDataError(f"Unknown product type: {product_type}")
+                    products.append(cls.PRODUCT_TYPES[product_type](**product_data))
+                inventory._add_products(products)
+            except InvalidProductDataError:
+                raise
+            except Exception as e:
+                raise InvalidProductDataError(f"Error creating product: {str(e)}")
             
             return inventory
         except json.JSONDecodeError:
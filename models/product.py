@@ -1,25 +1,64 @@
+import math
+import sys
+from decimal import Decimal, ROUND_HALF_UP
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 from exceptions.custom_exceptions import InsufficientStockError
 
+def _price_to_cents(price: float) -> int:
+    """
+    Convert a price to whole cents, rounding half up to the nearest cent.
+    
+    Args:
+        price (float): Price in currency units
+        
+    Returns:
+        int: Price in cents
+        
+    Raises:
+        ValueError: If the price is not a finite number
+    """
+    price = float(price)
+    if not math.isfinite(price):
+        raise ValueError("Price must be a finite number")
+    # repr gives the shortest decimal form, so 1.005 rounds to 1.01 as written
+    return int(Decimal(repr(price)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
 class Product(ABC):
     """Abstract base class for all products in the inventory system."""
     
+    __slots__ = ('_product_id', '_name', '_name_lower', '_price_cents',
+                 '_quantity_in_stock', '_value_listeners', '_str_prefix',
+                 '_str_cache')
+    
     def __init__(self, product_id: str, name: str, price: float, quantity_in_stock: int):
         """
         Initialize a new product.
         
         Args:
-            product_id (str): Unique identifier for the product
+            product_id (str): Unique identifier for the product; interned, so
+                it should be a short string that is safe to keep alive
             name (str): Name of the product
-            price (float): Price of the product
+            price (float): Price of the product, rounded to the nearest cent
             quantity_in_stock (int): Initial quantity in stock
+            
+        Raises:
+            ValueError: If the price is not a finite number
         """
-        self._product_id = product_id
+        # Interned IDs let dict lookups on the same key match by identity
+        self._product_id = sys.intern(product_id) if type(product_id) is str else product_id
         self._name = name
-        self._price = float(price)
+        self._name_lower = name.lower()
+        # Prices are held as whole cents so stock values sum exactly
+        self._price_cents = _price_to_cents(price)
         self._quantity_in_stock = int(quantity_in_stock)
+        # Called with the change in total stock value (in cents) whenever it changes
+        self._value_listeners: List[Callable[[int], None]] = []
+        # ID and name never change, so their display lines are built once
+        self._str_prefix = f"Product ID: {product_id}\nName: {name}\n"
+        # Full display string cached by subclasses; cleared whenever price or stock changes
+        self._str_cache: Optional[str] = None
         
     @property
     def product_id(self) -> str:
@@ -31,17 +70,28 @@ class Product(ABC):
         """Get the product name."""
         return self._name
     
+    @property
+    def name_lower(self) -> str:
+        """Get the lowercased product name used for case-insensitive search."""
+        return self._name_lower
+    
     @property
     def price(self) -> float:
-        """Get the product price."""
-        return self._price
+        """Get the product price, stored rounded to the nearest cent."""
+        return self._price_cents / 100
     
     @price.setter
     def price(self, new_price: float) -> None:
-        """Set a new price for the product."""
+        """Set a new price for the product, rounded to the nearest cent."""
         if new_price < 0:
             raise ValueError("Price cannot be negative")
-        self._price = float(new_price)
+        new_price_cents = _price_to_cents(new_price)
+        old_price_cents = self._price_cents
+        self._price_cents = new_price_cents
+        self._str_cache = None
+        self._notify_value_change(
+            (self._price_cents - old_price_cents) * self._quantity_in_stock
+        )
     
     @property
     def quantity_in_stock(self) -> int:
@@ -61,6 +111,8 @@ class Product(ABC):
         if amount < 0:
             raise ValueError("Restock amount cannot be negative")
         self._quantity_in_stock += amount
+        self._str_cache = None
+        self._notify_value_change(self._price_cents * amount)
     
     def sell(self, quantity: int) -> float:
         """
@@ -82,7 +134,35 @@ class Product(ABC):
             raise InsufficientStockError(self._product_id, quantity, self._quantity_in_stock)
         
         self._quantity_in_stock -= quantity
-        return self._price * quantity
+        self._str_cache = None
+        sale_cents = self._price_cents * quantity
+        self._notify_value_change(-sale_cents)
+        return sale_cents / 100
+    
+    def add_value_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Register a callback for changes in total stock value.
+        
+        Args:
+            listener (Callable[[int], None]): Called with the change in cents
+        """
+        self._value_listeners.append(listener)
+    
+    def remove_value_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Unregister a callback added with add_value_listener.
+        
+        Args:
+            listener (Callable[[int], None]): The callback to remove
+        """
+        if listener in self._value_listeners:
+            self._value_listeners.remove(listener)
+    
+    def _notify_value_change(self, delta: int) -> None:
+        """Report a change in total stock value to every inventory holding the product."""
+        if delta:
+            for listener in self._value_listeners:
+                listener(delta)
     
     def get_total_value(self) -> float:
         """
@@ -91,7 +171,11 @@ class Product(ABC):
         Returns:
             float: Total value (price * quantity)
         """
-        return self._price * self._quantity_in_stock
+        return self.stock_value_cents() / 100
+    
+    def stock_value_cents(self) -> int:
+        """Get the total value of current stock in cents."""
+        return self._price_cents * self._quantity_in_stock
     
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
@@ -104,7 +188,7 @@ class Product(ABC):
         return {
             'product_id': self._product_id,
             'name': self._name,
-            'price': self._price,
+            'price': self.price,
             'quantity_in_stock': self._quantity_in_stock,
             'type': self.__class__.__name__
         }
@@ -112,7 +196,6 @@ class Product(ABC):
     @abstractmethod
     def __str__(self) -> str:
         """Return a string representation of the product."""
-        return (f"Product ID: {self._product_id}\n"
-                f"Name: {self._name}\n"
-                f"Price: ${self._price:.2f}\n"
+        return (f"{self._str_prefix}"
+                f"Price: ${self.price:.2f}\n"
                 f"Quantity in Stock: {self._quantity_in_stock}") 
\ No newline at end of file